@@ -176,8 +176,8 @@ class BC(DeepAC):
         self._states_std = states.std(0) + eps
 
         # set them for the policy as well so that we use it when drawing actions
-        self.policy._states_mean = self._states_mean
-        self.policy._states_std = self._states_std
+        self.policy.states_mean = self._states_mean
+        self.policy.states_std = self._states_std
 
     def _norm_states(self, states: np.ndarray):
         if self._states_mean is None or self._states_std is None:
@@ -189,8 +189,8 @@ class BC(DeepAC):
         self._actions_std = actions.std(0) + eps
 
         # set them for the policy as well so that we use it when drawing actions
-        self.policy._actions_mean = self._actions_mean
-        self.policy._actions_std = self._actions_std
+        self.policy.actions_mean = self._actions_mean
+        self.policy.actions_std = self._actions_std
     
     def _norm_actions(self, actions: np.ndarray):
         if self._actions_mean is None or self._actions_std is None:
@@ -281,8 +281,8 @@ class IQL(DeepAC):
         self._states_std = states.std(0) + eps
 
         # set them for the policy as well so that we use it when drawing actions
-        self.policy._states_mean = self._states_mean
-        self.policy._states_std = self._states_std
+        self.policy.states_mean = self._states_mean
+        self.policy.states_std = self._states_std
 
     def _norm_states(self, states: np.ndarray):
         if self._states_mean is None or self._states_std is None:
@@ -38,7 +38,7 @@ class BoostedFQI(FQI):
                 self._next_q += self.approximator.predict(next_state,
                                                           idx=self._idx - 1)
                 if np.any(absorbing):
-                    self._next_q *= 1 - absorbing.reshape(-1, 1)
+                    self._next_q[absorbing.astype(bool, copy=False).ravel()] = 0
 
                 max_q = np.max(self._next_q, axis=1)
                 self._target = reward + self.mdp_info.gamma * max_q
@@ -45,7 +45,7 @@ class DoubleFQI(FQI):
                     max_q = self.approximator.predict(next_state[i], amax_q,
                                                       idx=1 - i)
                     if np.any(absorbing[i]):
-                        max_q *= 1 - absorbing[i]
+                        max_q[absorbing[i].astype(bool, copy=False)] = 0
                     self._target[i] = reward[i] + self.mdp_info.gamma * max_q
 
             for i in range(2):
@@ -41,7 +41,7 @@ class FQI(BatchTD):
             else:
                 q = self.approximator.predict(next_state)
                 if np.any(absorbing):
-                    q *= 1 - absorbing.reshape(-1, 1)
+                    q[absorbing.astype(bool, copy=False).ravel()] = 0
 
                 max_q = np.max(q, axis=1)
                 self._target = reward + self.mdp_info.gamma * max_q
@@ -38,7 +38,7 @@ class LSPI(BatchTD):
         while norm > self._epsilon():
             q = self.approximator.predict(next_state)
             if np.any(absorbing):
-                q *= 1 - absorbing.reshape(-1, 1)
+                q[absorbing.astype(bool, copy=False).ravel()] = 0
 
             next_action = np.argmax(q, axis=1).reshape(-1, 1)
             phi_next_state_next_action = get_action_features(phi_next_state, next_action, self.mdp_info.action_space.n)
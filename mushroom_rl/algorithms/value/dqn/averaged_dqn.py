@@ -57,6 +57,6 @@ class AveragedDQN(AbstractDQN):
             q.append(q_target_idx)
         q = np.mean(q, axis=0)
         if np.any(absorbing):
-            q *= 1 - absorbing.reshape(-1, 1)
+            q[absorbing.astype(bool, copy=False).ravel()] = 0
 
         return np.max(q, axis=1)
@@ -16,6 +16,6 @@ class DoubleDQN(DQN):
 
         double_q = self.target_approximator.predict(next_state, max_a, **self._predict_params)
         if np.any(absorbing):
-            double_q *= 1 - absorbing
+            double_q[absorbing.astype(bool, copy=False)] = 0
 
         return double_q
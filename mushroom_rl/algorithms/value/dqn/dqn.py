@@ -11,6 +11,6 @@ class DQN(AbstractDQN):
     def _next_q(self, next_state, absorbing):
         q = self.target_approximator.predict(next_state, **self._predict_params)
         if absorbing.any():
-            q *= 1 - absorbing.reshape(-1, 1)
+            q[absorbing.astype(bool, copy=False).ravel()] = 0
 
         return q.max(1)
@@ -1,5 +1,7 @@
 from copy import deepcopy
 
+import numpy as np
+
 from mushroom_rl.core.serialization import Serializable
 
 
@@ -71,6 +73,10 @@ class ListDataset(Serializable):
         if mask is not None:
             self._mask.append(mask)
 
+    def extend(self, *steps):
+        for step in zip(*steps):
+            self.append(*step)
+
     def clear(self):
         self._dataset = list()
 
@@ -96,6 +102,19 @@ class ListDataset(Serializable):
     def __getitem__(self, index):
         return self._dataset[index]
 
+    def parse(self):
+        if len(self) == 0:
+            # the list dataset does not know the shapes of its steps, so empty fields are returned as flat arrays
+            return np.empty(0), np.empty(0), np.empty(0), np.empty(0), np.empty(0, dtype=bool), np.empty(0, dtype=bool)
+
+        n_steps = len(self)
+        state, action, reward, next_state, absorbing, last = zip(*self._dataset)
+
+        # scalar fields have known dtype and length, so they are filled directly without shape discovery
+        return np.asarray(state), np.asarray(action), np.fromiter(reward, dtype=float, count=n_steps), \
+            np.asarray(next_state), np.fromiter(absorbing, dtype=bool, count=n_steps), \
+            np.fromiter(last, dtype=bool, count=n_steps)
+
     def __add__(self, other):
         result = self.create_new_instance(self)
         last_step = self._dataset[-1]
@@ -152,11 +171,8 @@ class ListDataset(Serializable):
 
     @property
     def n_episodes(self):
-        n_episodes = 0
-        for sample in self._dataset:
-            if sample[5] is True:
-                n_episodes += 1
-        if self._dataset[-1][5] is not True:
+        n_episodes = sum(sample[5] is True for sample in self._dataset)
+        if len(self) > 0 and self._dataset[-1][5] is not True:
             n_episodes += 1
 
         return n_episodes
@@ -132,6 +132,26 @@ class TorchDataset(Serializable):
 
         self._len += 1
 
+    def extend(self, states, actions, rewards, next_states, absorbings, lasts, policy_states=None,
+               policy_next_states=None):
+        i = self._len
+        n_steps = len(states)
+
+        self._states[i:i + n_steps] = states
+        self._actions[i:i + n_steps] = actions
+        self._rewards[i:i + n_steps] = rewards
+        self._next_states[i:i + n_steps] = next_states
+        self._absorbing[i:i + n_steps] = absorbings
+        self._last[i:i + n_steps] = lasts
+
+        if self.is_stateful:
+            self._policy_states[i:i + n_steps] = policy_states
+            self._policy_next_states[i:i + n_steps] = policy_next_states
+        else:
+            assert (policy_states is None) and (policy_next_states is None)
+
+        self._len += n_steps
+
     def clear(self):
         self._states = torch.empty_like(self._states)
         self._actions = torch.empty_like(self._actions)
@@ -200,6 +220,9 @@ class TorchDataset(Serializable):
         return self._states[index], self._actions[index], self._rewards[index], self._next_states[index], \
                self._absorbing[index], self._last[index]
 
+    def parse(self):
+        return self.state, self.action, self.reward, self.next_state, self.absorbing, self.last
+
     def __add__(self, other):
         result = self.create_new_instance(self)
 
@@ -266,7 +289,7 @@ class TorchDataset(Serializable):
     def n_episodes(self):
         n_episodes = self.last.sum()
 
-        if not self.last[-1]:
+        if len(self) > 0 and not self.last[-1]:
             n_episodes += 1
 
         return n_episodes
@@ -376,7 +376,7 @@ class ListBackend(ArrayBackend):
 
     @staticmethod
     def to_numpy(array):
-        return np.array(array)
+        return np.asarray(array)
 
     @staticmethod
     def to_torch(array):
@@ -406,6 +406,10 @@ class ListBackend(ArrayBackend):
         cls.check_device(device)
         return np.ones_like(array, dtype=dtype)
 
+    @staticmethod
+    def randint(low, high, size):
+        return NumpyBackend.randint(low, high, size)
+
     @staticmethod
     def copy(array):
         return array.copy()
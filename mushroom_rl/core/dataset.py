@@ -237,6 +237,11 @@ class Dataset(Serializable):
         self._data.append(*step)
         self._append_info(self._info, info)
 
+    def extend(self, steps, info):
+        self._data.extend(*steps)
+        for key, value in info.items():
+            self._info[key] += list(value)
+
     def append_episode_info(self, info):
         self._append_info(self._episode_info, info)
 
@@ -349,15 +354,10 @@ class Dataset(Serializable):
             A list of length of each episode in the dataset.
 
         """
-        lengths = list()
-        l = 0
-        for sample in self:
-            l += 1
-            if sample[-1] == 1:
-                lengths.append(l)
-                l = 0
+        last, = self._convert(self.last, to='numpy')
+        lengths = np.diff(np.flatnonzero(last), prepend=-1)
 
-        return self._array_backend.from_list(lengths)
+        return self._array_backend.from_list(lengths.tolist())
 
     @property
     def n_episodes(self):
@@ -391,7 +391,7 @@ class Dataset(Serializable):
         """
         if to is None:
             to = self._array_backend.get_backend_name()
-        return self._convert(self.state, self.action, self.reward, self.next_state, self.absorbing, self.last, to=to)
+        return self._convert(*self._data.parse(), to=to)
 
     def parse_policy_state(self, to=None):
         """
@@ -421,7 +421,8 @@ class Dataset(Serializable):
         """
         assert n_episodes > 0, 'Number of episodes must be greater than zero.'
 
-        last_idxs = np.argwhere(self.last).ravel()
+        last, = self._convert(self.last, to='numpy')
+        last_idxs = np.flatnonzero(last)
         return self[:last_idxs[n_episodes - 1] + 1]
 
     def select_random_samples(self, n_samples):
@@ -440,9 +441,9 @@ class Dataset(Serializable):
         assert n_samples >= 0, 'Number of samples must be greater than or equal to zero.'
 
         if n_samples == 0:
-            return np.array([[]])
+            return self[:0]
 
-        idxs = np.random.randint(len(self), size=n_samples)
+        idxs = self._array_backend.randint(0, len(self), (n_samples,))
 
         return self[idxs]
 
@@ -454,13 +455,16 @@ class Dataset(Serializable):
             An array of initial states of the considered dataset.
 
         """
-        pick = True
-        x_0 = list()
-        for step in self:
-            if pick:
-                x_0.append(step[0])
-            pick = step[-1]
-        return self._array_backend.from_list(x_0)
+        if len(self) == 0:
+            return self._array_backend.from_list(list())
+
+        last, = self._convert(self.last, to='numpy')
+        init_idxs = np.concatenate(([0], np.flatnonzero(last[:-1]) + 1))
+
+        if self._array_backend.get_backend_name() == 'list':
+            return self._data.get_view(init_idxs).state
+        else:
+            return self.state[init_idxs]
 
     def compute_J(self, gamma=1.):
         """
@@ -473,22 +477,13 @@ class Dataset(Serializable):
             The cumulative discounted reward of each episode in the dataset.
 
         """
-        js = list()
-
-        j = 0.
-        episode_steps = 0
-        for i in range(len(self)):
-            j += gamma ** episode_steps * self.reward[i]
-            episode_steps += 1
-            if self.last[i] or i == len(self) - 1:
-                js.append(j)
-                j = 0.
-                episode_steps = 0
+        rewards, lasts = self._convert(self.reward, self.last, to='numpy')
+        js = self._compute_episodes_J(rewards, lasts, gamma)
 
         if len(js) == 0:
-            js = [0.]
+            js = np.zeros(1)
 
-        return self._array_backend.from_list(js)
+        return self._convert_from_numpy(js)
 
     def compute_metrics(self, gamma=1.):
         """
@@ -507,16 +502,12 @@ class Dataset(Serializable):
             If no episode has been completed, it returns 0 for all values.
 
         """
-        i = 0
-        for i in reversed(range(len(self))):
-            if self.last[i]:
-                i += 1
-                break
-
-        dataset = self[:i]
+        rewards, lasts = self._convert(self.reward, self.last, to='numpy')
+        last_idxs = np.flatnonzero(lasts)
 
-        if len(dataset) > 0:
-            J = dataset.compute_J(gamma)
+        if len(last_idxs) > 0:
+            n_steps = last_idxs[-1] + 1
+            J = self._convert_from_numpy(self._compute_episodes_J(rewards[:n_steps], lasts[:n_steps], gamma))
             median = self._array_backend.median(J)
             return J.min(), J.max(), J.mean(), median, len(J)
         else:
@@ -530,6 +521,14 @@ class Dataset(Serializable):
         else:
             return NotImplementedError
 
+    def _convert_from_numpy(self, array):
+        backend_name = self._array_backend.get_backend_name()
+
+        if backend_name == 'list':
+            return array.tolist()
+        else:
+            return ArrayBackend.convert(array, to=backend_name)
+
     def _add_all_save_attr(self):
         self._add_save_attr(
             _info='pickle',
@@ -540,6 +539,24 @@ class Dataset(Serializable):
             _dataset_info='mushroom'
         )
 
+    @staticmethod
+    def _compute_episodes_J(rewards, lasts, gamma):
+        n_steps = len(rewards)
+
+        if n_steps == 0:
+            return np.empty(0)
+
+        episode_ends = np.flatnonzero(lasts[:-1]) + 1
+        episode_starts = np.concatenate(([0], episode_ends))
+        episode_lengths = np.diff(np.append(episode_starts, n_steps))
+
+        episode_steps = np.arange(n_steps) - np.repeat(episode_starts, episode_lengths)
+
+        # running product of the discount factor, shared by all the episodes
+        discounts = np.cumprod(np.r_[1., np.full(episode_lengths.max() - 1, gamma)])
+
+        return np.add.reduceat(rewards * discounts[episode_steps], episode_starts)
+
     @staticmethod
     def _append_info(info, step_info):
         for key, value in step_info.items():
@@ -1,6 +1,8 @@
 import torch
 import numpy as np
 
+from mushroom_rl.utils.torch import TorchUtils
+
 from .policy import ParametricPolicy
 
 
@@ -26,10 +28,10 @@ class OrnsteinUhlenbeckPolicy(ParametricPolicy):
         """
         self._approximator = mu
         self._predict_params = dict()
-        self._sigma = sigma
+        self._sigma = torch.as_tensor(sigma, device=TorchUtils.get_device())
         self._theta = theta
         self._dt = dt
-        self._x0 = x0
+        self._x0 = None if x0 is None else torch.as_tensor(x0, device=TorchUtils.get_device())
         self._x_prev = None
 
         self.reset()
@@ -50,11 +52,11 @@ class OrnsteinUhlenbeckPolicy(ParametricPolicy):
 
     def draw_action(self, state, policy_state):
         with torch.no_grad():
-            mu = self._approximator.predict(state, **self._predict_params).cpu()
+            mu = self._approximator.predict(state, **self._predict_params)
             sqrt_dt = np.sqrt(self._dt)
 
             x = policy_state - self._theta * policy_state * self._dt +\
-                self._sigma * sqrt_dt * torch.randn(size=self._approximator.output_shape)
+                self._sigma * sqrt_dt * torch.randn(size=mu.shape, device=mu.device)
 
             return mu + x, x
 
@@ -69,7 +71,10 @@ class OrnsteinUhlenbeckPolicy(ParametricPolicy):
         return self._approximator.weights_size
 
     def reset(self):
-        return self._x0 if self._x0 is not None else torch.zeros(self._approximator.output_shape)
+        if self._x0 is not None:
+            return self._x0
+        else:
+            return torch.zeros(self._approximator.output_shape, device=TorchUtils.get_device())
 
 
 class ClippedGaussianPolicy(ParametricPolicy):
@@ -112,9 +117,9 @@ class ClippedGaussianPolicy(ParametricPolicy):
 
         self._approximator = mu
         self._predict_params = dict()
-        self._chol_sigma = torch.linalg.cholesky(sigma)
-        self._low = torch.as_tensor(low)
-        self._high = torch.as_tensor(high)
+        self._chol_sigma = torch.linalg.cholesky(torch.as_tensor(sigma, device=TorchUtils.get_device()))
+        self._low = torch.as_tensor(low, device=TorchUtils.get_device())
+        self._high = torch.as_tensor(high, device=TorchUtils.get_device())
         self._draw_random_act = draw_random_act
         self._draw_deterministic = draw_deterministic
         self._squash_actions = squash_actions
@@ -123,6 +128,7 @@ class ClippedGaussianPolicy(ParametricPolicy):
         self._normalize_states = normalize_states
         self._states_mean = None # will be set by the agent class
         self._states_std = None # will be set by the agent class
+        self._inv_states_std = None
         self._normalize_actions = normalize_actions
         self._actions_mean = None # will be set by the agent class
         self._actions_std = None # will be set by the agent class
@@ -145,11 +151,11 @@ class ClippedGaussianPolicy(ParametricPolicy):
             _discrete_action_dims='primitive',
             _continuous_action_dims='primitive',
             _normalize_states='primitive',
-            _states_mean='primitive',
-            _states_std='primitive',
+            _states_mean='torch',
+            _states_std='torch',
             _normalize_actions='primitive',
-            _actions_mean='primitive',
-            _actions_std='primitive',
+            _actions_mean='torch',
+            _actions_std='torch',
             debug_replay_states='primitive',
             debug_replay_actions='primitive',
             debug_replay_index='primitive',
@@ -170,39 +176,23 @@ class ClippedGaussianPolicy(ParametricPolicy):
             if self._normalize_states:
                 if self._states_mean is None:
                     raise ValueError('States mean is not set by the agent class')
-                state_query = (state - self._states_mean) / self._states_std
+                state_query = (state - self._states_mean) * self._inv_states_std
             else:
                 state_query = state
                 
-            mu = self._approximator.predict(state_query, **self._predict_params).cpu()
-            # mu = np.reshape(self._approximator.predict(np.expand_dims(state_query, axis=0), **self._predict_params), -1)
-            if self._squash_actions:
-                # Squash the continuous actions to [-1, 1]
-                mu[-self._continuous_action_dims:] = torch.tanh(mu[-self._continuous_action_dims:])
-
-            if self._normalize_actions:
-                if self._actions_mean is None:
-                    raise ValueError('Actions mean is not set by the agent class')
-                mu = mu * self._actions_std + self._actions_mean
-
-            # sample continuous actions from distribution
-            distribution = torch.distributions.MultivariateNormal(loc=mu[-self._continuous_action_dims:], scale_tril=self._chol_sigma,
-                                                                  validate_args=False)
-            action_raw = distribution.sample()
-
-            if self._discrete_action_dims > 0:
-                # discrete actions from network are logits, so sigmoid them
-                action_disc = torch.sigmoid(mu[:self._discrete_action_dims])
-                action = torch.cat((action_disc, action_raw), dim=0)
-                # print("action: ", torch.round(action*100)/100)
-            else:
-                action = action_raw
+            mu = self._approximator.predict(state_query, **self._predict_params)
+
+            # sample continuous actions from the gaussian with fixed Cholesky factor
+            noise_shape = mu.shape[:-1] + self._chol_sigma.shape[-1:]
+            noise = torch.randn(noise_shape, device=mu.device) @ self._chol_sigma.T
+
+            action = self._assemble_action(mu, noise)
 
-            return torch.clip(action, self._low, self._high), None
+            return action.clamp_(self._low, self._high), None
 
     
     def draw_random_action(self):
-        return torch.rand(self._low.shape) * (self._high - self._low) + self._low, None
+        return torch.rand(self._low.shape, device=self._low.device) * (self._high - self._low) + self._low, None
 
     def draw_deterministic_action(self, state, policy_state=None):
         with torch.no_grad():
@@ -219,35 +209,18 @@ class ClippedGaussianPolicy(ParametricPolicy):
                 if self._normalize_states:
                     if self._states_mean is None:
                         raise ValueError('States mean is not set by the agent class')
-                    state_query = (state - self._states_mean) / self._states_std
+                    state_query = (state - self._states_mean) * self._inv_states_std
                 else:
                     state_query = state
             
-            mu = self._approximator.predict(state_query, **self._predict_params).cpu()
-            # mu = np.reshape(self._approximator.predict(np.expand_dims(state_query, axis=0), **self._predict_params), -1)
-            
-            if self._squash_actions:
-                # Squash the continuous actions to [-1, 1]
-                mu[-self._continuous_action_dims:] = torch.tanh(mu[-self._continuous_action_dims:])
-
-            if self._normalize_actions:
-                if self._actions_mean is None:
-                    raise ValueError('Actions mean is not set by the agent class')
-                mu = mu * self._actions_std + self._actions_mean
-            
-            action_raw = mu[-self._continuous_action_dims:]
+            mu = self._approximator.predict(state_query, **self._predict_params)
 
-            if self._discrete_action_dims > 0:
-                # discrete actions from network are logits, so sigmoid them
-                action_disc = torch.sigmoid(mu[:self._discrete_action_dims])
-                action = torch.cat((action_disc, action_raw), dim=0)
-                # print("action: ", torch.round(action*100)/100)
-            else:
-                action = action_raw
+            action = self._assemble_action(mu)
 
             ## Debug for distribution shift...
             if self.debug_replay_actions is not None:
-                next_replay_action = torch.tensor(self.debug_replay_actions[self.debug_replay_index])
+                next_replay_action = torch.tensor(self.debug_replay_actions[self.debug_replay_index],
+                                                  device=action.device)
                 self.debug_replay_index += 1
 
                 # Check if the network action is the same as the replay action
@@ -258,10 +231,37 @@ class ClippedGaussianPolicy(ParametricPolicy):
                 action = next_replay_action
             ## Debug end
 
-            action_clipped = torch.clip(action, self._low, self._high)
-            
-            return action_clipped, None
-    
+            return action.clamp_(self._low, self._high), None
+
+    def forward(self, state):
+        """
+        Compute the deterministic action for a batch of states using only tensor operations. Differently from
+        ``draw_deterministic_action``, the network is called directly, without going through the regressor
+        interface, so this method can be used in tight evaluation loops or exported with ``torch.export``.
+        Only regressors with a single torch model and no prediction parameters are supported.
+
+        Args:
+            state (torch.tensor): a batch of states, on the device of the approximator.
+
+        Returns:
+            The batch of clipped deterministic actions.
+
+        """
+        model = self._approximator.model
+        assert hasattr(model, 'network'), 'forward is only supported for regressors with a single torch model.'
+        assert len(self._predict_params) == 0, 'forward does not support prediction parameters.'
+
+        with torch.no_grad():
+            if self._normalize_states:
+                if self._states_mean is None:
+                    raise ValueError('States mean is not set by the agent class')
+                state = (state - self._states_mean) * self._inv_states_std
+
+            mu = model.network(state)
+            action = self._assemble_action(mu)
+
+            return action.clamp_(self._low, self._high)
+
     def set_weights(self, weights):
         self._approximator.set_weights(weights)
 
@@ -271,3 +271,91 @@ class ClippedGaussianPolicy(ParametricPolicy):
     @property
     def weights_size(self):
         return self._approximator.weights_size
+
+    @property
+    def states_mean(self):
+        return self._states_mean
+
+    @states_mean.setter
+    def states_mean(self, states_mean):
+        self._states_mean = torch.as_tensor(states_mean, dtype=torch.float, device=TorchUtils.get_device())
+
+    @property
+    def states_std(self):
+        return self._states_std
+
+    @states_std.setter
+    def states_std(self, states_std):
+        self._states_std = torch.as_tensor(states_std, dtype=torch.float, device=TorchUtils.get_device())
+        self._inv_states_std = 1. / self._states_std
+
+    @property
+    def actions_mean(self):
+        return self._actions_mean
+
+    @actions_mean.setter
+    def actions_mean(self, actions_mean):
+        self._actions_mean = torch.as_tensor(actions_mean, dtype=torch.float, device=TorchUtils.get_device())
+
+    @property
+    def actions_std(self):
+        return self._actions_std
+
+    @actions_std.setter
+    def actions_std(self, actions_std):
+        self._actions_std = torch.as_tensor(actions_std, dtype=torch.float, device=TorchUtils.get_device())
+
+    def _post_load(self):
+        if self._states_mean is not None:
+            self.states_mean = self._states_mean
+
+        if self._states_std is not None:
+            self.states_std = self._states_std
+        else:
+            self._inv_states_std = None
+
+        if self._actions_mean is not None:
+            self.actions_mean = self._actions_mean
+
+        if self._actions_std is not None:
+            self.actions_std = self._actions_std
+
+    def _assemble_action(self, mu, noise=None):
+        """
+        Build the (unclipped) action from the output of the regressor.
+
+        Args:
+            mu (torch.tensor): the output of the regressor, possibly batched;
+            noise (torch.tensor, None): the noise to add to the continuous actions.
+
+        Returns:
+            The action, with the discrete actions first and the continuous ones last.
+
+        """
+        if self._squash_actions:
+            # Squash the continuous actions to [-1, 1]
+            mu[..., -self._continuous_action_dims:].tanh_()
+
+        if self._normalize_actions:
+            if self._actions_mean is None:
+                raise ValueError('Actions mean is not set by the agent class')
+            mu = mu * self._actions_std + self._actions_mean
+
+        mu_continuous = mu[..., -self._continuous_action_dims:]
+
+        if self._discrete_action_dims == 0:
+            return mu_continuous if noise is None else mu_continuous + noise
+
+        # write discrete and continuous actions directly into the action tensor, avoiding the concatenation
+        action_shape = mu.shape[:-1] + (self._discrete_action_dims + mu_continuous.shape[-1],)
+        action = torch.empty(action_shape, dtype=mu.dtype, device=mu.device)
+
+        # discrete actions from network are logits, so sigmoid them
+        torch.sigmoid(mu[..., :self._discrete_action_dims], out=action[..., :self._discrete_action_dims])
+
+        if noise is None:
+            action[..., self._discrete_action_dims:] = mu_continuous
+        else:
+            torch.add(mu_continuous, noise, out=action[..., self._discrete_action_dims:])
+
+        return action
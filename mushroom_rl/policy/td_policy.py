@@ -61,7 +61,7 @@ class EpsGreedy(TDPolicy):
     def __call__(self, *args):
         state = args[0]
         q = self._approximator.predict(np.expand_dims(state, axis=0), **self._predict_params).ravel()
-        max_a = np.argwhere(q == np.max(q)).ravel()
+        max_a = np.flatnonzero(q == np.max(q))
 
         p = self._epsilon.get_value(state) / self._approximator.n_actions
 
@@ -80,7 +80,7 @@ class EpsGreedy(TDPolicy):
     def draw_action(self, state, policy_state=None):
         if not np.random.uniform() < self._epsilon(state):
             q = self._approximator.predict(state, **self._predict_params)
-            max_a = np.argwhere(q == np.max(q)).ravel()
+            max_a = np.flatnonzero(q == np.max(q))
 
             if len(max_a) > 1:
                 max_a = np.array([np.random.choice(max_a)])
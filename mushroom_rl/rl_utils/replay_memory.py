@@ -11,7 +11,7 @@ class ReplayMemory(Serializable):
     "Human-Level Control Through Deep Reinforcement Learning" by Mnih V. et al..
 
     """
-    def __init__(self, mdp_info, agent_info, initial_size, max_size):
+    def __init__(self, mdp_info, agent_info, initial_size, max_size, prefetch_batches=1):
         """
         Constructor.
 
@@ -20,11 +20,17 @@ class ReplayMemory(Serializable):
             agent_info (AgentInfo): information about the agent;
             initial_size (int): initial size of the replay buffer;
             max_size (int): maximum size of the replay buffer;
+            prefetch_batches (int, 1): number of minibatches of indices to draw at once from the random number
+                generator. Indices are prefetched only once the replay memory is full, as its size no longer
+                changes.
 
         """
 
+        assert prefetch_batches >= 1, 'The number of prefetched minibatches must be at least one.'
+
         self._initial_size = initial_size
         self._max_size = max_size
+        self._prefetch_batches = prefetch_batches
         self._idx = 0
         self._full = False
         self._mdp_info = mdp_info
@@ -39,6 +45,7 @@ class ReplayMemory(Serializable):
         self._add_save_attr(
             _initial_size='primitive',
             _max_size='primitive',
+            _prefetch_batches='primitive',
             _mdp_info='mushroom',
             _agent_info='mushroom',
             _idx='primitive!',
@@ -67,6 +74,10 @@ class ReplayMemory(Serializable):
         else:
             policy_state, policy_next_state = (None, None)
 
+        if n_steps_return == 1:
+            self._add_transitions(state, action, reward, next_state, absorbing, last, policy_state, policy_next_state)
+            return
+
         # TODO: implement vectorized n_step_return to avoid loop
         i = 0
         while i < len(dataset) - n_steps_return + 1:
@@ -108,6 +119,44 @@ class ReplayMemory(Serializable):
 
                 i += 1
 
+    def _add_transitions(self, state, action, reward, next_state, absorbing, last, policy_state, policy_next_state):
+        n_samples = len(state)
+
+        i = 0
+        while i < n_samples:
+            n_block = min(n_samples - i, self._max_size - self._idx)
+            block = slice(i, i + n_block)
+
+            if self._full:
+                idxs = slice(self._idx, self._idx + n_block)
+
+                self._dataset.state[idxs] = state[block]
+                self._dataset.action[idxs] = action[block]
+                self._dataset.reward[idxs] = reward[block]
+                self._dataset.next_state[idxs] = next_state[block]
+                self._dataset.absorbing[idxs] = absorbing[block]
+                self._dataset.last[idxs] = last[block]
+
+                if self._dataset.is_stateful:
+                    self._dataset.policy_state[idxs] = policy_state[block]
+                    self._dataset.policy_next_state[idxs] = policy_next_state[block]
+
+            else:
+                samples = [state[block], action[block], reward[block], next_state[block], absorbing[block],
+                           last[block]]
+
+                if self._dataset.is_stateful:
+                    samples += [policy_state[block], policy_next_state[block]]
+
+                self._dataset.extend(samples, {})
+
+            self._idx += n_block
+            if self._idx == self._max_size:
+                self._full = True
+                self._idx = 0
+
+            i += n_block
+
     def get(self, n_samples):
         """
         Returns the provided number of states from the replay memory.
@@ -117,7 +166,7 @@ class ReplayMemory(Serializable):
         Returns:
             The requested number of samples.
         """
-        idxs = self._dataset.array_backend.randint(0, len(self._dataset), (n_samples,))
+        idxs = self._sample_idxs(n_samples)
 
         dataset_batch = self._dataset[idxs]
 
@@ -135,6 +184,7 @@ class ReplayMemory(Serializable):
         self._full = False
         dataset_info = DatasetInfo.create_replay_memory_info(self._mdp_info, self._agent_info)
         self._dataset = Dataset(dataset_info, n_steps=self._max_size)
+        self._reset_prefetched_idxs()
 
     @property
     def initialized(self):
@@ -159,9 +209,33 @@ class ReplayMemory(Serializable):
     def _backend(self):
         return self._dataset.array_backend
 
+    def _sample_idxs(self, n_samples):
+        size = len(self._dataset)
+
+        if self._prefetch_batches == 1 or not self._full:
+            return self._backend.randint(0, size, (n_samples,))
+
+        if self._prefetched_idxs is None or self._prefetched_pos + n_samples > len(self._prefetched_idxs):
+            self._prefetched_idxs = self._backend.randint(0, size, (n_samples * self._prefetch_batches,))
+            self._prefetched_pos = 0
+
+        idxs = self._prefetched_idxs[self._prefetched_pos:self._prefetched_pos + n_samples]
+        self._prefetched_pos += n_samples
+
+        return idxs
+
+    def _reset_prefetched_idxs(self):
+        self._prefetched_idxs = None
+        self._prefetched_pos = 0
+
     def _post_load(self):
+        if getattr(self, '_prefetch_batches', None) is None:
+            self._prefetch_batches = 1
+
         if self._full is None:
             self.reset()
+        else:
+            self._reset_prefetched_idxs()
 
 
 class SequenceReplayMemory(ReplayMemory):
@@ -48,7 +48,7 @@ def learn(alg, alg_params):
 def test_fqi():
     params = dict(n_iterations=10)
     _, j = learn(FQI, params)
-    j_test = -0.06763797713952796
+    j_test = -0.06763797713952795
 
     assert j == j_test
 
@@ -72,7 +72,7 @@ def test_fqi_save(tmpdir):
 def test_fqi_boosted():
     params = dict(n_iterations=10)
     _, j = learn(BoostedFQI, params)
-    j_test = -0.04487241596542538
+    j_test = -0.04487241596542537
 
     assert j == j_test
 
@@ -96,7 +96,7 @@ def test_fqi_boosted_save(tmpdir):
 def test_double_fqi():
     params = dict(n_iterations=10)
     _, j = learn(DoubleFQI, params)
-    j_test = -0.19933233708925654
+    j_test = -0.1993323370892565
 
     assert j == j_test
 
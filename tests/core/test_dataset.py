@@ -58,6 +58,11 @@ def test_dataset():
     assert np.array_equal(ab, ab_test)
     assert np.array_equal(last, last_test)
 
+    samples = dataset.select_random_samples(0)
+    s, a, r, ss, ab, last = samples.parse()
+    assert len(samples) == 0 and samples.n_episodes == 0
+    assert s.shape == (0, 1) and a.shape == (0, 1) and r.shape == (0,) and last.dtype == bool
+
     s0 = dataset.get_init_states()
     s0_test = np.zeros((10, 1))
     assert np.array_equal(s0, s0_test)
@@ -71,6 +76,43 @@ def test_dataset():
     assert n_episodes == 2
 
 
+def test_dataset_compute_J():
+    np.random.seed(42)
+
+    n_steps = 3000
+    states = np.random.rand(n_steps, 1)
+    actions = np.zeros((n_steps, 1))
+    rewards = np.random.randn(n_steps)
+    absorbings = np.zeros(n_steps, dtype=bool)
+
+    uneven_lasts = np.zeros(n_steps, dtype=bool)
+    uneven_lasts[4:1000:5] = True
+
+    for lasts in [np.zeros(n_steps, dtype=bool), uneven_lasts]:
+        lasts[[2, 1500, 1501, 2400]] = True
+
+        gamma = 0.99
+        J_test = list()
+        j = 0.
+        episode_steps = 0
+        for reward, last in zip(rewards, lasts):
+            j += gamma ** episode_steps * reward
+            episode_steps += 1
+            if last:
+                J_test.append(j)
+                j = 0.
+                episode_steps = 0
+        J_test.append(j)
+
+        dataset = Dataset.from_array(states, actions, rewards, states, absorbings, lasts)
+        J = dataset.compute_J(gamma)
+        assert len(J) == len(J_test) and np.allclose(J, J_test)
+
+        torch_dataset = Dataset.from_array(states, actions, rewards, states, absorbings, lasts, backend='torch')
+        J = torch_dataset.compute_J(gamma)
+        assert J.dtype == torch.float64 and np.allclose(J.cpu().numpy(), J_test)
+
+
 def test_dataset_creation():
     np.random.seed(42)
 
@@ -103,6 +145,12 @@ def test_dataset_creation():
     for array_1, array_2 in zip(parsed_torch, new_torch_dataset.parse(to='torch')):
         assert torch.equal(array_1, array_2)
 
+    empty_torch_dataset = Dataset.from_array(*(array[:0] for array in parsed), gamma=mdp.info.gamma, backend='torch')
+    samples = empty_torch_dataset.select_random_samples(0)
+    s, a, r, ss, ab, last = samples.parse()
+    assert len(samples) == 0
+    assert s.shape == (0, 1) and a.shape == (0, 1) and r.shape == (0,)
+
 
 def test_dataset_loading(tmpdir):
     np.random.seed(42)
@@ -67,5 +67,51 @@ def test_clipped_gaussian_policy():
     else:
         assert False
 
-# TODO Missing test for clipped gaussian!
 
+def test_noise_policies_batch():
+    torch.manual_seed(42)
+
+    mu = Regressor(TorchApproximator, network=LinearNetwork, input_shape=(5,), output_shape=(2,))
+    state = torch.randn(4, 5)
+
+    pi = OrnsteinUhlenbeckPolicy(mu, sigma=torch.ones(1) * .2, theta=.15, dt=1e-2)
+    action, policy_state = pi.draw_action(state, pi.reset())
+    assert action.shape == (4, 2) and policy_state.shape == (4, 2)
+
+    action, policy_state = pi.draw_action(state, policy_state)
+    assert action.shape == (4, 2) and policy_state.shape == (4, 2)
+
+    pi = ClippedGaussianPolicy(mu, torch.eye(1), -torch.ones(2), torch.ones(2),
+                               discrete_action_dims=1, continuous_action_dims=1)
+    action, _ = pi.draw_action(state)
+    assert action.shape == (4, 2)
+
+    action, _ = pi.draw_deterministic_action(state)
+    assert action.shape == (4, 2)
+
+    assert torch.allclose(pi.forward(state), action)
+
+
+def test_clipped_gaussian_policy_save(tmpdir):
+    torch.manual_seed(42)
+
+    policy_path = tmpdir / 'policy'
+
+    mu = Regressor(TorchApproximator, network=LinearNetwork, input_shape=(5,), output_shape=(2,))
+    pi = ClippedGaussianPolicy(mu, torch.eye(2), -torch.ones(2), torch.ones(2),
+                               normalize_states=True, normalize_actions=True)
+    pi.states_mean = torch.randn(5)
+    pi.states_std = torch.rand(5) + 1.
+    pi.actions_mean = torch.randn(2)
+    pi.actions_std = torch.rand(2) + 1.
+
+    pi.save(policy_path)
+    pi_load = ClippedGaussianPolicy.load(policy_path)
+
+    assert torch.equal(pi_load.states_mean, pi.states_mean)
+    assert torch.equal(pi_load.states_std, pi.states_std)
+    assert torch.equal(pi_load.actions_mean, pi.actions_mean)
+    assert torch.equal(pi_load.actions_std, pi.actions_std)
+
+    state = torch.randn(4, 5)
+    assert torch.allclose(pi_load.forward(state), pi.forward(state))
@@ -0,0 +1,122 @@
+import numpy as np
+import torch
+
+from mushroom_rl.core import AgentInfo, Dataset, MDPInfo
+from mushroom_rl.core.dataset import DatasetInfo
+from mushroom_rl.rl_utils.replay_memory import ReplayMemory
+from mushroom_rl.rl_utils.spaces import Box, Discrete
+
+
+def generate_dataset(backend, stateful, n_steps, offset):
+    mdp_info = MDPInfo(Box(-np.inf, np.inf, (2,)), Discrete(3), 0.9, 100, backend=backend)
+    agent_info = AgentInfo(is_episodic=False, policy_state_shape=(1,) if stateful else None, backend=backend)
+    dataset = Dataset.generate(mdp_info, agent_info, n_steps=n_steps)
+
+    array = np.array if backend == 'numpy' else torch.tensor
+    for i in range(offset, offset + n_steps):
+        step = [array([i, -i], dtype=float), array([i % 3]), float(i), array([i + 1, -i - 1], dtype=float),
+                i % 7 == 6, i % 5 == 4]
+        if stateful:
+            step += [array([i], dtype=float), array([i + 1], dtype=float)]
+        dataset.append(step, {})
+
+    return mdp_info, agent_info, dataset
+
+
+def append_per_sample(memory, dataset):
+    steps = list(zip(*dataset.parse()))
+    if dataset.is_stateful:
+        steps = [step + policy_step for step, policy_step in zip(steps, zip(*dataset.parse_policy_state()))]
+
+    fields = ['state', 'action', 'reward', 'next_state', 'absorbing', 'last', 'policy_state', 'policy_next_state']
+    for step in steps:
+        if memory._full:
+            for field, value in zip(fields, step):
+                getattr(memory._dataset, field)[memory._idx] = value
+        else:
+            memory._dataset.append(step, {})
+
+        memory._idx += 1
+        if memory._idx == memory._max_size:
+            memory._full = True
+            memory._idx = 0
+
+
+def check_replay_memory_add(backend, stateful):
+    max_size = 7
+    n_steps = 3
+
+    memory = None
+    memory_test = None
+    for k in range(5):
+        mdp_info, agent_info, dataset = generate_dataset(backend, stateful, n_steps, k * n_steps)
+        if memory is None:
+            memory = ReplayMemory(mdp_info, agent_info, 1, max_size)
+            memory_test = ReplayMemory(mdp_info, agent_info, 1, max_size)
+
+        memory.add(dataset)
+        append_per_sample(memory_test, dataset)
+
+        assert memory._idx == memory_test._idx and memory._full == memory_test._full
+
+        arrays = memory._dataset.parse(to='numpy')
+        arrays_test = memory_test._dataset.parse(to='numpy')
+        if stateful:
+            arrays += memory._dataset.parse_policy_state(to='numpy')
+            arrays_test += memory_test._dataset.parse_policy_state(to='numpy')
+
+        for array, array_test in zip(arrays, arrays_test):
+            assert np.array_equal(array, array_test)
+
+    assert memory._full and memory.size == max_size
+
+
+def test_replay_memory_add():
+    for backend in ['numpy', 'torch']:
+        for stateful in [False, True]:
+            check_replay_memory_add(backend, stateful)
+
+
+def check_replay_memory_prefetch(backend):
+    max_size = 7
+    n_samples = 3
+    prefetch_batches = 4
+
+    memory = None
+    for k in range(4):
+        mdp_info, agent_info, dataset = generate_dataset(backend, False, 2, 2 * k)
+        if memory is None:
+            memory = ReplayMemory(mdp_info, agent_info, 1, max_size, prefetch_batches=prefetch_batches)
+
+        memory.add(dataset)
+
+        idxs = memory._sample_idxs(n_samples)
+        assert len(idxs) == n_samples and 0 <= idxs.min() and idxs.max() < memory.size
+
+    assert memory._full
+    memory._reset_prefetched_idxs()
+
+    np.random.seed(1)
+    torch.manual_seed(1)
+    idxs = [memory._sample_idxs(n_samples) for _ in range(2 * prefetch_batches)]
+
+    np.random.seed(1)
+    torch.manual_seed(1)
+    idxs_test = [memory._backend.randint(0, max_size, (n_samples * prefetch_batches,)) for _ in range(2)]
+
+    for i in range(2 * prefetch_batches):
+        j, k = divmod(i, prefetch_batches)
+        assert (idxs[i] == idxs_test[j][k * n_samples:(k + 1) * n_samples]).all()
+
+
+def test_replay_memory_prefetch():
+    for backend in ['numpy', 'torch']:
+        check_replay_memory_prefetch(backend)
+
+    mdp_info, agent_info, _ = generate_dataset('numpy', False, 1, 0)
+    try:
+        ReplayMemory(mdp_info, agent_info, 1, 7, prefetch_batches=0)
+    except AssertionError:
+        pass
+    else:
+        assert False